@@ -55,6 +55,22 @@ class DTGeometry:
         if attribute is None:
             return element
 
+        return self.get_from_element(element, attribute, query=query)
+
+    def get_from_element(self, element, attribute, query=None):
+        """
+        Retrieve a specific attribute or sub-element from an already located XML element.
+
+        :param element: The XML element to read the attribute from.
+        :type element: xml.etree.ElementTree.Element
+        :param attribute: The attribute to retrieve (e.g., 'GlobalPosition', 'LocalPosition', 'Bounds').
+        :type attribute: str
+        :param query: The XPath query used to locate the element, only used in error messages.
+        :type query: str, optional
+        :return: The requested attribute values or element.
+        :rtype: tuple, str, or xml.etree.ElementTree.Element
+        :raises ValueError: If the element or attribute is not found.
+        """
         if element is not None:
             if attribute in ["GlobalPosition", "LocalPosition", "NormalVector"]:
                 try:
@@ -108,6 +124,7 @@ class DTGeometry:
 # Initialize the DTGeometry object with the path to the XML file
 DTGEOMETRY = DTGeometry(os.path.join(os.path.dirname(__file__), "./DTGeometry_v3.xml"))
 
+
 # Example usage
 if __name__ == "__main__":
     dt_geometry = DTGeometry(os.path.abspath("./DTGeometry_v3.xml"))
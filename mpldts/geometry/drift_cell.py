@@ -15,6 +15,7 @@
 from mpldts.geometry._geometry import DTGEOMETRY
 from mpldts.geometry.dt_frame import DTFrame
 from mpldts.geometry.transforms import TransformManager
+import numpy as np
 import warnings as Warning
 
 
@@ -32,6 +33,11 @@ class DriftCell(DTFrame):
             Number of the drift cell. Same as id.
 
         Others inherit from ``mpldts.geometry.DTFrame``... (e.g. local_center, direction, etc.)
+
+    .. note::
+        Cell attributes set from a ``pandas.DataFrame`` are stored column-wise in the parent super layer
+        (see ``SuperLayer.cell_arrays``), they are still read, set and deleted as plain attributes of
+        the cell.
     """
 
     def __init__(self, number=-1, parent=None):
@@ -60,6 +66,76 @@ class DriftCell(DTFrame):
             self.local_center = (0, 0, 0)
             self.global_center = (0, 0, 0)
 
+    def __getattr__(self, name):
+        """
+        Look up a cell attribute stored column-wise in the parent super layer. It is only called when
+        the attribute is not found on the cell itself.
+
+        :param name: Name of the attribute.
+        :type name: str
+        :return: Value of the attribute for this cell.
+        :raises AttributeError: If the attribute is not set for this cell.
+        """
+        super_layer, index = self._cell_column_owner(name)
+        if super_layer is not None:
+            column = super_layer._cell_arrays[name]
+            if not np.ma.getmaskarray(column)[index]:
+                value = column.data[index]
+                return value.item() if isinstance(value, np.generic) else value
+        raise AttributeError(f"'{type(self).__name__}' object has no attribute '{name}'")
+
+    def __setattr__(self, name, value):
+        """
+        Set a cell attribute. Attributes stored column-wise in the parent super layer are written
+        into their column, so the cell and the super layer never hold different values.
+
+        :param name: Name of the attribute.
+        :type name: str
+        :param value: Value of the attribute.
+        :type value: object
+        """
+        super_layer, index = self._cell_column_owner(name)
+        if super_layer is None:
+            super().__setattr__(name, value)
+        else:
+            super_layer._set_cell_column(name, index[0] + 1, index[1] + 1, value)
+
+    def __delattr__(self, name):
+        """
+        Delete a cell attribute. Attributes stored column-wise in the parent super layer are masked
+        in their column.
+
+        :param name: Name of the attribute.
+        :type name: str
+        :raises AttributeError: If the attribute is not set for this cell.
+        """
+        super_layer, index = self._cell_column_owner(name)
+        if super_layer is None:
+            super().__delattr__(name)
+        elif np.ma.getmaskarray(super_layer._cell_arrays[name])[index]:
+            raise AttributeError(f"'{type(self).__name__}' object has no attribute '{name}'")
+        else:
+            super_layer._cell_arrays[name][index] = np.ma.masked
+
+    def _cell_column_owner(self, name):
+        """
+        Find the parent super layer storing the given attribute column-wise, and the position of the
+        cell in that column.
+
+        :param name: Name of the attribute.
+        :type name: str
+        :return: Super layer and ``(layer - 1, wire - 1)`` index, or ``(None, None)`` if the
+            attribute is not stored column-wise.
+        :rtype: tuple
+        """
+        if not name.startswith("_"):
+            layer = vars(self).get("_parent")
+            super_layer = vars(layer).get("_parent") if layer is not None else None
+            columns = vars(super_layer).get("_cell_arrays", {}) if super_layer is not None else {}
+            if name in columns:
+                return super_layer, (layer._number - 1, self._number - 1)
+        return None, None
+
     def _setup_tranformer(self):
         """
         Set up the transformer for the Drift Cell. It defines the transformation from the local frame to the global frame.
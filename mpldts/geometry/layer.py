@@ -20,7 +20,7 @@ class Layer(DTFrame):
         Others inherit from ``mpldts.geometry.DTFrame``... (e.g. id, local_center, global_center, direction, etc.)
     """
 
-    def __init__(self, rawId=None, parent=None):
+    def __init__(self, rawId=None, parent=None, xml_node=None):
         """
         Constructor of the Layer class.
 
@@ -28,16 +28,22 @@ class Layer(DTFrame):
         :type rawId: int
         :param parent: Parent super layer of the layer. Default is None.
         :type parent: SuperLayer, optional
+        :param xml_node: XML element of the layer in the DT geometry. If not given, it is looked up by
+                ``rawId``. Default is None.
+        :type xml_node: xml.etree.ElementTree.Element, optional
         """
         self.id = rawId
         self.parent = parent
+        self._xml_node = xml_node if xml_node is not None else DTGEOMETRY.get(rawId=rawId)
         if rawId is not None:
-            self.number = int(DTGEOMETRY.get("layerNumber", rawId=rawId))
-            self.local_center = DTGEOMETRY.get("LocalPosition", rawId=rawId)
-            self.global_center = DTGEOMETRY.get("GlobalPosition", rawId=rawId)
-            self.bounds = DTGEOMETRY.get("Bounds", rawId=rawId)
+            self.number = int(DTGEOMETRY.get_from_element(self._xml_node, "layerNumber"))
+            self.local_center = DTGEOMETRY.get_from_element(self._xml_node, "LocalPosition")
+            self.global_center = DTGEOMETRY.get_from_element(self._xml_node, "GlobalPosition")
+            self.bounds = DTGEOMETRY.get_from_element(self._xml_node, "Bounds")
             # these attributes are used inside cell() method to check if the cell_id is valid
-            self._first_cell_id, self._last_cell_id = DTGEOMETRY.get("WiresRange", rawId=rawId)
+            self._first_cell_id, self._last_cell_id = DTGEOMETRY.get_from_element(
+                self._xml_node, "WiresRange"
+            )
         else:
             self._first_cell_id = 1
             self._last_cell_id = 50
@@ -96,8 +102,8 @@ class Layer(DTFrame):
         """
         Ensemble a DT layer.
         """
-        wire_bounds = DTGEOMETRY.get("WiresSize", rawId=self.id)
-        for wire in DTGEOMETRY.get("Wires", rawId=self.id).iter("Wire"):
+        wire_bounds = DTGEOMETRY.get_from_element(self._xml_node, "WiresSize")
+        for wire in DTGEOMETRY.get_from_element(self._xml_node, "Wires").iter("Wire"):
             num, local_pos_str, global_pos_str = wire.attrib.values()
 
             cell = DriftCell(number=int(num))
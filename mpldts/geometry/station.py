@@ -1,11 +1,176 @@
 from mpldts.geometry._geometry import DTGEOMETRY
+from mpldts.geometry.drift_cell import DriftCell
 from mpldts.geometry.dt_frame import DTFrame
 from mpldts.geometry.super_layer import SuperLayer
 from mpldts.geometry.transforms import TransformManager
-from pandas import DataFrame
-from copy import deepcopy
+from pandas import DataFrame, unique
+from pandas.api.extensions import ExtensionDtype
+from functools import lru_cache
+import numpy as np
+import re
 import warnings
 
+# Names handled by data descriptors (properties or slots) on DriftCell. Attributes with these names must go
+# through setattr, any other attribute can be written straight into the instance __dict__.
+_CELL_DATA_DESCRIPTORS = frozenset(
+    name for name in dir(DriftCell) if hasattr(getattr(DriftCell, name), "__set__")
+)
+
+# sectors of the wheel 0 whose stations are facing towards the -z axis
+_ZERO_WHEEL_NEG_SECTORS = frozenset({1, 4, 5, 8, 9, 12, 13})
+
+
+def _column_values(series):
+    """
+    Get the values of a DataFrame column as a NumPy array. Missing values of pandas nullable dtypes
+    (e.g. ``Int64`` or ``string``) are returned as None inside an object array, as
+    ``DataFrame.to_dict`` does, instead of being cast to NaN. Datetime and timedelta values are kept
+    as pandas ``Timestamp`` and ``Timedelta`` objects.
+
+    :param series: DataFrame column.
+    :type series: pandas.Series
+    :return: Values of the column.
+    :rtype: numpy.ndarray
+    """
+    if series.dtype.kind in "mM":
+        return series.astype(object).to_numpy()
+    if isinstance(series.dtype, ExtensionDtype) and series.hasnans:
+        return series.to_numpy(dtype=object, na_value=None)
+    return series.to_numpy()
+
+
+def _cross3(a, b):
+    """
+    Cross product of two 3D vectors written component-wise, which avoids the overhead of the generic
+    NumPy/pytransform3d routines for such small inputs.
+
+    :param a: First vector (x, y, z).
+    :type a: array-like
+    :param b: Second vector (x, y, z).
+    :type b: array-like
+    :return: Cross product a x b.
+    :rtype: numpy.ndarray
+    """
+    return np.array(
+        [
+            a[1] * b[2] - a[2] * b[1],
+            a[2] * b[0] - a[0] * b[2],
+            a[0] * b[1] - a[1] * b[0],
+        ]
+    )
+
+
+def _axes_to_rotation(ex, ey, ez):
+    """
+    Build a rotation matrix whose columns are the given axes, writing them into a preallocated 3x3 array.
+
+    :param ex: x axis of the rotated frame.
+    :type ex: array-like
+    :param ey: y axis of the rotated frame.
+    :type ey: array-like
+    :param ez: z axis of the rotated frame.
+    :type ez: array-like
+    :return: Rotation matrix.
+    :rtype: numpy.ndarray
+    """
+    R = np.empty((3, 3))
+    R[:, 0] = ex
+    R[:, 1] = ey
+    R[:, 2] = ez
+    return R
+
+
+def _cms_rotation_matrix(direction, face_orientation):
+    """
+    Build the rotation matrix from the Station frame to the CMS global frame. Its columns are the Station
+    axes in the CMS frame: z is the normal vector of the station, y is the CMS z axis times the face
+    orientation, and x is the cross product of both, written out component by component.
+
+    :param direction: Normal vector of the station in the CMS frame.
+    :type direction: tuple
+    :param face_orientation: Orientation of the station face along the z axis (-1 or 1).
+    :type face_orientation: int
+    :return: Rotation matrix.
+    :rtype: numpy.ndarray
+    """
+    dx, dy, dz = direction
+    R = np.empty((3, 3))
+    R[0, 0], R[1, 0], R[2, 0] = -face_orientation * dy, face_orientation * dx, 0.0
+    R[0, 1], R[1, 1], R[2, 1] = 0.0, 0.0, face_orientation
+    R[0, 2], R[1, 2], R[2, 2] = dx, dy, dz
+    return R
+
+
+def _nv_rotation_matrices(face_orientation):
+    """
+    Build the rotation matrices from the Station frame to the Station 'Natural view' frames (NV phi/eta).
+    They only depend on the face orientation of the station, so they are precomputed at import time.
+
+    :param face_orientation: Orientation of the station face along the z axis (-1 or 1).
+    :type face_orientation: int
+    :return: Rotation matrices for the NV phi and NV eta frames.
+    :rtype: tuple
+    """
+    StNvezSt = np.array([0, 0, -1])
+    StNvPhieySt = np.array([0, -1, 0]) * face_orientation
+    StNvPhiexSt = _cross3(StNvPhieySt, StNvezSt)
+
+    StNvEtaexSt = np.array([-1, 0, 0]) * face_orientation
+    StNvEtaeySt = _cross3(StNvezSt, StNvEtaexSt)
+
+    return (
+        _axes_to_rotation(StNvPhiexSt, StNvPhieySt, StNvezSt),
+        _axes_to_rotation(StNvEtaexSt, StNvEtaeySt, StNvezSt),
+    )
+
+
+_NV_PHI_ROT = {face: _nv_rotation_matrices(face)[0] for face in (-1, 1)}
+_NV_ETA_ROT = {face: _nv_rotation_matrices(face)[1] for face in (-1, 1)}
+
+
+@lru_cache(maxsize=None)
+def _chamber_index():
+    """
+    Index all the chambers of the DT geometry by (wheel, sector, station) with a single tree traversal.
+
+    :return: Chamber XML elements by (wheel, sector, station).
+    :rtype: dict
+    """
+    index = {}
+    for node in DTGEOMETRY.root.iter("Chamber"):
+        wh, st, sec = (int(value) for value in re.findall(r"[-+]?\d+", node.get("Id")))
+        index[(wh, sec, st)] = node
+    return index
+
+
+@lru_cache(maxsize=None)
+def _chamber_node(wh, sec, st):
+    """
+    Look up a chamber in the DT geometry and read its attributes. Results are cached, since the number
+    of (wheel, sector, station) combinations is bounded.
+
+    :param wh: Wheel position within CMS.
+    :type wh: int
+    :param sec: Sector position within CMS.
+    :type sec: int
+    :param st: Station type (1: MB1, 2: MB2, 3: MB3, or 4: MB4).
+    :type st: int
+    :return: rawId, local position, global position, normal vector, bounds and the chamber XML element.
+    :rtype: tuple
+    :raises ValueError: If the chamber does not exist in the DT geometry.
+    """
+    node = _chamber_index().get((wh, sec, st))
+    if node is None:
+        raise ValueError(f"Chamber not found: Wh:{wh} Se:{sec} St:{st}")
+    return (
+        DTGEOMETRY.get_from_element(node, "rawId"),
+        DTGEOMETRY.get_from_element(node, "LocalPosition"),
+        DTGEOMETRY.get_from_element(node, "GlobalPosition"),
+        DTGEOMETRY.get_from_element(node, "NormalVector"),
+        DTGEOMETRY.get_from_element(node, "Bounds"),
+        node,
+    )
+
 
 class Station(DTFrame):
     """
@@ -46,21 +211,44 @@ class Station(DTFrame):
         self.wheel = wheel
         self.sector = sector
         self.number = station
-        self.id = DTGEOMETRY.get("rawId", wh=wheel, sec=sector, st=station)
-        self.local_center = DTGEOMETRY.get("LocalPosition", rawId=self.id)
-        self.global_center = DTGEOMETRY.get("GlobalPosition", rawId=self.id)
-        self.direction = DTGEOMETRY.get("NormalVector", rawId=self.id)
-        self.bounds = DTGEOMETRY.get("Bounds", rawId=self.id)
+        (
+            self.id,
+            self.local_center,
+            self.global_center,
+            self.direction,
+            self.bounds,
+            self._xml_node,
+        ) = _chamber_node(wheel, sector, station)
         self._setup_tranformer()
 
-        # == Build the station
-        self._super_layers = []
+        # == Build the station (super layers are built on first access)
+        self._super_layers = {}
         self._build_station()
 
         # == Set the drift cell attributes
         if dt_info is not None:
             self.set_cell_attrs(dt_info)
 
+    @classmethod
+    def build_many(cls, triples, dt_info_by_triple=None):
+        """
+        Convenience wrapper to build several stations at once, each with its own drift cell information.
+        Equivalent to calling the constructor for each (wheel, sector, station).
+
+        :param triples: (wheel, sector, station) of each station to build.
+        :type triples: iterable of tuple
+        :param dt_info_by_triple: Drift cell information for the stations, keyed by (wheel, sector, station).
+                Each value accepts the same formats as ``dt_info`` in the constructor. Default is None.
+        :type dt_info_by_triple: dict, optional
+        :return: List of stations, in the same order as ``triples``.
+        :rtype: list of Station
+        """
+        dt_info_by_triple = dt_info_by_triple or {}
+        return [
+            cls(wheel, sector, station, dt_info=dt_info_by_triple.get((wheel, sector, station)))
+            for wheel, sector, station in triples
+        ]
+
     # == Getters
 
     @property
@@ -96,23 +284,31 @@ class Station(DTFrame):
     @property
     def super_layers(self):
         """
-        Get all the super layers in the station.
+        Get all the super layers in the station. Super layers not accessed yet are built here.
 
-        :return: List of super layers in the station.
+        :return: List of super layers in the station, in geometry file order.
         :rtype: list
         """
-        return self._super_layers
+        return [self.super_layer(number) for number in self._sl_nodes]
 
     def super_layer(self, super_layer_number):
         """
         Get a super layer by its number. if the super layer does not exist, it returns None.
+        The super layer is built on the first access and cached afterwards.
 
         :param super_layer_number: Number of the super layer.
         :type super_layer_number: int
         :return: Super layer with the specified number.
         :rtype: SuperLayer
         """
-        return next((sl for sl in self._super_layers if sl.number == super_layer_number), None)
+        super_layer = self._super_layers.get(super_layer_number)
+        if super_layer is None:
+            SL = self._sl_nodes.get(super_layer_number)
+            if SL is None:
+                return None
+            super_layer = SuperLayer(rawId=SL.get("rawId"), parent=self, xml_node=SL)
+            self._super_layers[super_layer_number] = super_layer
+        return super_layer
 
     # == Setters
 
@@ -156,76 +352,47 @@ class Station(DTFrame):
             raise ValueError("Station value must be between 1 and 4")
         self._number = value
 
-    def _add_super_layer(self, super_layer):
-        """
-        Add a new super layer to the station.
-
-        :param super_layer: Super layer to be added.
-        :type super_layer: SuperLayer
-        """
-        self._super_layers.append(super_layer)
-
     def _build_station(self):
         """
-        Build up the station. It creates the super layers contained in the station.
+        Build up the station. It registers the geometry nodes of the super layers contained in the station,
+        the super layers themselves are built lazily by ``super_layer``.
         """
-        for SL in DTGEOMETRY.get(rawId=self.id).iter("SuperLayer"):
-            self._add_super_layer(SuperLayer(rawId=SL.get("rawId"), parent=self))
+        self._sl_nodes = {
+            int(SL.get("superLayerNumber")): SL for SL in self._xml_node.iter("SuperLayer")
+        }
 
     def _setup_tranformer(self):
         """
         Set up the transformer for the station. It defines the transformation from the local frame to the global frame.
         """
-        from pytransform3d.rotations import perpendicular_to_vectors
-        from numpy import array
-
         self.transformer = TransformManager("Station")  # intial frame is the station frame
 
         # negative wheel are facing towards the -z axis, positive wheel towards the +z axis, and 0 wheel is facing towards the +-z axis depending on the sector
         face_orientation = (
             -1
             if self._wheel < 0
-            else 1 if self._wheel > 0 else -1 if self._sector in [1, 4, 5, 8, 9, 12, 13] else 1
+            else 1 if self._wheel > 0 else -1 if self._sector in _ZERO_WHEEL_NEG_SECTORS else 1
         )
 
         # Define the transformation from Station frame to CMS global frame
-
-        CMSezSt = self._direction
-        CMSeySt = array([0, 0, 1]) * face_orientation
-        CMSexSt = perpendicular_to_vectors(
-            CMSeySt, CMSezSt
-        )  # cross product to get the x axis of the local frame respect to the global frame
-
-        _RCMSSt = array([CMSexSt, CMSeySt, CMSezSt]).T  # rotation matrix from local to global frame
-        _TCMSSt = [
-            self._x_global,
-            self._y_global,
-            self._z_global,
-        ]  # translation vector from the DT center to the CMS center (0,0,0)
+        _RCMSSt = _cms_rotation_matrix(
+            self._direction, face_orientation
+        )  # rotation matrix from local to global frame
+        _TCMSSt = np.array(
+            [self._x_global, self._y_global, self._z_global], dtype=np.float64
+        )  # translation vector from the DT center to the CMS center (0,0,0)
 
         self.transformer.add(
             "Station", "CMS", rotation_matrix=_RCMSSt, translation_vector=_TCMSSt
         )  # add the transformation from local to global frame
 
         # add a orientation transformation (Station 'Natural view' - NV phi/eta), useful for matplotlib ploting.
-        StNvezSt = array([0, 0, -1])
-        StNvPhieySt = array([0, -1, 0]) * face_orientation
-        StNvPhiexSt = perpendicular_to_vectors(StNvPhieySt, StNvezSt)
-
-        _RStNvPhiSt = array(
-            [StNvPhiexSt, StNvPhieySt, StNvezSt]
-        ).T  # rotation matrix from local to global frame
-
-        self.transformer.add("Station", "StationNvPhi", rotation_matrix=_RStNvPhiSt)
-
-        StNvEtaexSt = array([-1, 0, 0]) * face_orientation
-        StNvEtaeySt = perpendicular_to_vectors(StNvezSt, StNvEtaexSt)
-
-        _RStNvPhiSt = array(
-            [StNvEtaexSt, StNvEtaeySt, StNvezSt]
-        ).T  # rotation matrix from local to global frame
-
-        self.transformer.add("Station", "StationNvEta", rotation_matrix=_RStNvPhiSt)
+        self.transformer.add(
+            "Station", "StationNvPhi", rotation_matrix=_NV_PHI_ROT[face_orientation]
+        )
+        self.transformer.add(
+            "Station", "StationNvEta", rotation_matrix=_NV_ETA_ROT[face_orientation]
+        )
 
     def set_cell_attrs(self, dt_info):
         """
@@ -235,23 +402,34 @@ class Station(DTFrame):
                 or a pandas DataFrame containing the drift cell attributes, they should be identified by super layer,
                 layer, and wire. e.g. ``[{"sl": 1, "l": 1, "w": 1, "time": 300}, ...]``
         :type dt_info: dict, list, or pandas.DataFrame
+
+        .. note::
+            Attributes given as a pandas DataFrame are stored column-wise in the super layers (see
+            ``SuperLayer.cell_arrays``) instead of in the cells ``__dict__``, so they do not show up
+            in ``vars(cell)``. They are still read, set and deleted as plain cell attributes. Later
+            dict or list values for an attribute already stored column-wise go to its column too.
         """
+        if isinstance(dt_info, DataFrame):
+            self._set_cell_attrs_from_dataframe(dt_info)
+            return
+
         if isinstance(dt_info, dict):
-            info = [deepcopy(dt_info)]
-        elif isinstance(dt_info, DataFrame):
-            info = dt_info.to_dict(orient="records")
+            info = [dict(dt_info)]
         elif isinstance(dt_info, list):
-            info = deepcopy(dt_info)
+            info = [dict(info_item) for info_item in dt_info]
         else:
             raise TypeError(
                 "The drift time information must be a dictionary, a list of dictionaries, or a pandas DataFrame."
             )
 
+        # values of attributes already stored column-wise, gathered by (super layer, attribute)
+        column_values = {}
+
         for info_item in info:
             sl = info_item.pop("sl", None)
             l = info_item.pop("l", None)
             w = info_item.pop("w", None)
-            if not all([sl, l, w]):
+            if sl is None or l is None or w is None:
                 raise ValueError(
                     "The drift cell information must contain the super layer, layer, and wire identifiers."
                 )
@@ -261,10 +439,66 @@ class Station(DTFrame):
                 warnings.warn(f"Super layer {sl} does not exist in station {self.name}.")
                 continue
 
-            cell = self.super_layer(sl).layer(l).cell(w)
+            cell = super_layer.layer(l).cell(w)
+
+            if super_layer._cell_arrays:
+                # attributes already stored column-wise in the super layer are kept there
+                for key in super_layer._cell_arrays.keys() & info_item.keys():
+                    ls, ws, values = column_values.setdefault((super_layer, key), ([], [], []))
+                    ls.append(int(l))
+                    ws.append(int(w))
+                    values.append(info_item.pop(key))
+
+            if _CELL_DATA_DESCRIPTORS.isdisjoint(info_item):
+                vars(cell).update(info_item)
+            else:
+                for key, value in info_item.items():
+                    setattr(cell, key, value)
+
+        for (super_layer, key), (ls, ws, values) in column_values.items():
+            super_layer._set_cell_column(key, ls, ws, values)
 
-            for key, value in info_item.items():
-                setattr(cell, key, value)
+    def _set_cell_attrs_from_dataframe(self, dt_info):
+        """
+        Set the attributes for the drift cells in the station from a pandas DataFrame. The columns are read
+        as NumPy arrays, rows are selected by super layer, and each attribute column is scattered at once
+        into the column-wise cell storage of the super layer. Attributes handled by ``DriftCell``
+        properties, and private (``_``-prefixed) attributes, are set cell by cell.
+
+        :param dt_info: Drift cell information with ``sl``, ``l`` and ``w`` columns plus the attributes to set.
+        :type dt_info: pandas.DataFrame
+        """
+        if not {"sl", "l", "w"}.issubset(dt_info.columns):
+            raise ValueError(
+                "The drift cell information must contain the super layer, layer, and wire identifiers."
+            )
+        sl_arr = dt_info["sl"].to_numpy()
+        l_arr = dt_info["l"].to_numpy()
+        w_arr = dt_info["w"].to_numpy()
+        columns = {
+            col: _column_values(dt_info[col])
+            for col in dt_info.columns
+            if col not in ("sl", "l", "w")
+        }
+
+        for sl in unique(sl_arr):
+            super_layer = self.super_layer(sl)
+
+            if super_layer is None:
+                warnings.warn(f"Super layer {sl} does not exist in station {self.name}.")
+                continue
+
+            rows = sl_arr == sl
+            l = l_arr[rows]
+            w = w_arr[rows]
+            l, w = super_layer._check_cell_numbers(l, w)
+
+            for key, values in columns.items():
+                if key in _CELL_DATA_DESCRIPTORS or key.startswith("_"):
+                    for l_i, w_i, value in zip(l, w, values[rows].tolist()):
+                        setattr(super_layer.layer(l_i).cell(w_i), key, value)
+                else:
+                    super_layer._set_cell_column(key, l, w, values[rows])
 
 
 if __name__ == "__main__":
@@ -293,5 +527,11 @@ if __name__ == "__main__":
             print(3 * "\t", l.cell(len(l.cells) - 1))
     print(
         "\t",
-        f"properties contained into cells: {st.super_layer(1).layer(1).cells[0].__dict__.keys()}",
+        f"properties contained into cells: {st.super_layer(1).layer(1).cell(10).__dict__.keys()}",
+    )
+    # attributes set from a pandas DataFrame are stored column-wise in the super layers instead
+    st.set_cell_attrs(DataFrame({"sl": [1, 3], "l": [1, 1], "w": [11, 11], "charge": [5, 7]}))
+    print(
+        "\t",
+        f"properties stored column-wise in super layers: {st.super_layer(1).cell_arrays.keys()}",
     )
@@ -1,7 +1,67 @@
 from mpldts.geometry._geometry import DTGEOMETRY
+from mpldts.geometry.drift_cell import DriftCell
 from mpldts.geometry.dt_frame import DTFrame
 from mpldts.geometry.layer import Layer
 from mpldts.geometry.transforms import TransformManager
+import numpy as np
+
+
+def _as_values_array(values, shape):
+    """
+    Convert cell attribute values into an array of the given shape. Values that NumPy would expand
+    into extra dimensions (e.g. tuples), or sequences of values of mixed types, are kept as objects.
+
+    :param values: Value(s) of a cell attribute.
+    :type values: object or array-like
+    :param shape: Expected shape, () for a single cell.
+    :type shape: tuple
+    :return: Array of values.
+    :rtype: numpy.ndarray
+    """
+    array = np.asarray(values)
+    mixed_types = shape and not isinstance(values, np.ndarray) and len(set(map(type, values))) > 1
+    if array.shape != shape or mixed_types:
+        array = np.empty(shape, dtype=object)
+        if shape:
+            for i, value in enumerate(values):
+                array[i] = value
+        else:
+            array[()] = values
+    return array
+
+
+def _as_cell_numbers(numbers, kind):
+    """
+    Convert layer or wire numbers into an integer array.
+
+    :param numbers: Layer or wire numbers.
+    :type numbers: numpy.ndarray
+    :param kind: Kind of number ("layer" or "cell"), used in the error message.
+    :type kind: str
+    :return: Integer array of numbers.
+    :rtype: numpy.ndarray
+    :raises ValueError: If a number is not integral (e.g. NaN or 2.5).
+    """
+    if numbers.dtype.kind in "iu":
+        return numbers
+    try:
+        as_float = numbers.astype(float)
+    except (TypeError, ValueError):
+        as_float = np.array([_to_float(number) for number in numbers])
+    invalid = ~np.isfinite(as_float) | (as_float != np.round(as_float))
+    if invalid.any():
+        raise ValueError(f"Invalid {kind} number: {numbers[invalid][0]}")
+    return as_float.astype(int)
+
+
+def _to_float(value):
+    """
+    Convert a value into a float, or NaN if it is not a number.
+    """
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return np.nan
 
 
 class SuperLayer(DTFrame):
@@ -16,11 +76,13 @@ class SuperLayer(DTFrame):
             Number of the super layer (1, 2, or 3).
         layers : list
             List of layers in the super layer.
+        cell_arrays : dict
+            Cell attributes stored column-wise, as masked arrays indexed by ``[layer - 1, wire - 1]``.
 
         Others inherit from ``mpldts.geometry.DTFrame``... (e.g. id, local_center, global_center, direction, etc.)
     """
 
-    def __init__(self, rawId=None, parent=None):
+    def __init__(self, rawId=None, parent=None, xml_node=None):
         """
         Constructor of the SuperLayer class.
 
@@ -28,16 +90,21 @@ class SuperLayer(DTFrame):
         :type rawId: int
         :param parent: Parent station of the super layer. Default is None.
         :type parent: Station, optional
+        :param xml_node: XML element of the super layer in the DT geometry. If not given, it is looked
+                up by ``rawId``. Default is None.
+        :type xml_node: xml.etree.ElementTree.Element, optional
         """
         self.id = rawId
         self.parent = parent
+        self._xml_node = xml_node if xml_node is not None else DTGEOMETRY.get(rawId=rawId)
         if rawId is not None:
-            self.number = int(DTGEOMETRY.get("superLayerNumber", rawId=rawId))
-            self.local_center = DTGEOMETRY.get("LocalPosition", rawId=rawId)
-            self.global_center = DTGEOMETRY.get("GlobalPosition", rawId=rawId)
-            self.bounds = DTGEOMETRY.get("Bounds", rawId=rawId)
+            self.number = int(DTGEOMETRY.get_from_element(self._xml_node, "superLayerNumber"))
+            self.local_center = DTGEOMETRY.get_from_element(self._xml_node, "LocalPosition")
+            self.global_center = DTGEOMETRY.get_from_element(self._xml_node, "GlobalPosition")
+            self.bounds = DTGEOMETRY.get_from_element(self._xml_node, "Bounds")
         self._setup_tranformer()
         self._layers = []
+        self._cell_arrays = {}
         self._build_super_layer()
 
     @property
@@ -50,6 +117,38 @@ class SuperLayer(DTFrame):
         """
         return self._layers
 
+    @property
+    def cell_arrays(self):
+        """
+        Get the cell attributes stored column-wise in the super layer. Each attribute is a
+        ``numpy.ma.MaskedArray`` of shape (4, max. number of wires) indexed by ``[layer - 1, wire - 1]``,
+        where cells without a value are masked.
+
+        :return: Dictionary of cell attribute arrays by attribute name.
+        :rtype: dict
+        """
+        return self._cell_arrays
+
+    def cells_values(self, name, default=0):
+        """
+        Get the values of a cell attribute for all the cells of the super layer, following the order of
+        ``layers`` and ``Layer.cells``. Attributes stored column-wise are read in one vectorized pass,
+        any other attribute is read from the cells themselves.
+
+        :param name: Name of the cell attribute.
+        :type name: str
+        :param default: Value used for the cells without the attribute. Default is 0.
+        :type default: object, optional
+        :return: Values of the attribute.
+        :rtype: numpy.ndarray or list
+        """
+        column = self._cell_arrays.get(name)
+        if column is not None:
+            return column.filled(default)[self._cell_indices]
+        if hasattr(DriftCell, name):
+            return [getattr(cell, name, default) for layer in self._layers for cell in layer.cells]
+        return [vars(cell).get(name, default) for layer in self._layers for cell in layer.cells]
+
     @DTFrame.number.setter
     def number(self, number):
         """
@@ -87,8 +186,86 @@ class SuperLayer(DTFrame):
         """
         Build up the super layer. It creates the layers contained in the super layer.
         """
-        for layer in DTGEOMETRY.get(rawId=self.id).iter("Layer"):
-            self._add_layer(Layer(layer.get("rawId"), parent=self))
+        for layer in self._xml_node.iter("Layer"):
+            self._add_layer(Layer(layer.get("rawId"), parent=self, xml_node=layer))
+        self._cell_arrays_shape = (4, max((l._last_cell_id for l in self._layers), default=0))
+        # position in the cell arrays of every cell, following the layers/cells iteration order
+        self._cell_indices = (
+            np.array([l.number - 1 for l in self._layers for _ in l.cells], dtype=int),
+            np.array([c.number - 1 for l in self._layers for c in l.cells], dtype=int),
+        )
+        # wire ranges by layer number (index 0 is unused), missing layers get an empty range
+        self._first_cell_ids = np.ones(5, dtype=int)
+        self._last_cell_ids = np.zeros(5, dtype=int)
+        for l in self._layers:
+            self._first_cell_ids[l.number] = l._first_cell_id
+            self._last_cell_ids[l.number] = l._last_cell_id
+
+    def _check_cell_numbers(self, l, w):
+        """
+        Check that the given layer and wire numbers identify cells of the super layer. Numbers may come
+        as floats (e.g. after merging DataFrames with missing values) as long as they are integral.
+
+        :param l: Layer numbers of the cells.
+        :type l: numpy.ndarray
+        :param w: Wire numbers of the cells.
+        :type w: numpy.ndarray
+        :return: Layer and wire numbers as integer arrays.
+        :rtype: tuple
+        :raises ValueError: If a layer number or a wire number is invalid.
+        """
+        l = _as_cell_numbers(l, "layer")
+        w = _as_cell_numbers(w, "cell")
+        invalid = (l < 1) | (l > 4)
+        if invalid.any():
+            raise ValueError(f"Invalid layer number: {l[invalid][0]}")
+        invalid = (w < self._first_cell_ids[l]) | (w > self._last_cell_ids[l])
+        if invalid.any():
+            raise ValueError(f"Invalid cell number: {w[invalid][0]}")
+        return l, w
+
+    def _set_cell_column(self, name, l, w, values):
+        """
+        Store the values of a cell attribute column-wise. The column is created on its first write. If
+        new values do not fit in it, its dtype is widened within the same kind (e.g. int32 to int64),
+        and it becomes an ``object`` column when the kinds differ (e.g. bool and int, or int and
+        float), so every cell keeps the type of the value it was given. Values previously set on the
+        cells themselves under the same name are moved into the new column.
+
+        :param name: Name of the cell attribute.
+        :type name: str
+        :param l: Layer number(s) of the cells.
+        :type l: int or array-like
+        :param w: Wire number(s) of the cells.
+        :type w: int or array-like
+        :param values: Value(s) of the attribute for the cells.
+        :type values: object or array-like
+        """
+        l = np.asarray(l)
+        w = np.asarray(w)
+        values = _as_values_array(values, np.broadcast_shapes(l.shape, w.shape))
+        column = self._cell_arrays.get(name)
+
+        if column is None:
+            column = np.ma.masked_all(self._cell_arrays_shape, dtype=values.dtype)
+            self._cell_arrays[name] = column
+            moved = [
+                (layer.number, cell.number, vars(cell).pop(name))
+                for layer in self._layers
+                for cell in layer.cells
+                if name in vars(cell)
+            ]
+            if moved:
+                self._set_cell_column(name, *zip(*moved))
+                column = self._cell_arrays[name]
+        elif column.dtype != object and values.dtype.kind != column.dtype.kind:
+            column = column.astype(object)
+            self._cell_arrays[name] = column
+        elif not np.can_cast(values.dtype, column.dtype, casting="safe"):
+            column = column.astype(np.result_type(column.dtype, values.dtype))
+            self._cell_arrays[name] = column
+
+        column[l - 1, w - 1] = values[()] if values.ndim == 0 else values
 
     def _setup_tranformer(self):
         """
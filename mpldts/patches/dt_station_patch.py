@@ -123,11 +123,8 @@ class DTStationPatch(DTRelatedPatch):
                 continue  # skip superlayer 1 and 3
             for layer in super_layer.layers:
                 for cell in layer.cells:
-                    cell_patch = self._create_frame(cell)
-                    var = getattr(cell, self.vmap, 0)
-
-                    cells.append(cell_patch)
-                    vars.append(var)
+                    cells.append(self._create_frame(cell))
+            vars.extend(super_layer.cells_values(self.vmap, 0))
 
         self.cells_collection.set_paths(cells)
         self.cells_collection.set_array(vars)
@@ -170,9 +167,6 @@ class DTStationPatch(DTRelatedPatch):
                 continue  # skip superlayer 2
             elif self.view == "eta" and super_layer.number != 2:
                 continue  # skip superlayer 1 and 3
-            for layer in super_layer.layers:
-                for cell in layer.cells:
-                    var = getattr(cell, self.vmap, 0)
-                    vars.append(var)
+            vars.extend(super_layer.cells_values(self.vmap, 0))
 
         self.cells_collection.set_array(vars)
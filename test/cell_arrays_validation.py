@@ -0,0 +1,92 @@
+from mpldts.geometry import Station
+import pandas as pd
+import numpy as np
+
+# Cell attributes set from a DataFrame are stored column-wise in each super layer (SuperLayer.cell_arrays),
+# while dicts and lists of dicts set them on the cells. Both must read back the same values and types.
+
+
+def cell(station, sl, l, w):
+    return station.super_layer(sl).layer(l).cell(w)
+
+
+def check(label, value, expected):
+    assert (
+        type(value) is type(expected) and value == expected
+    ), f"{label}: {value!r} != {expected!r}"
+    print(f"{label}: {value!r}")
+
+
+chamber = Station(wheel=-2, sector=1, station=2)
+
+# bool set on a cell, then int values from a DataFrame: each cell keeps its own type
+chamber.set_cell_attrs({"sl": 1, "l": 1, "w": 10, "flag": True})
+chamber.set_cell_attrs(pd.DataFrame({"sl": [1], "l": [1], "w": [11], "flag": [1]}))
+check("bool then int (bool cell)", cell(chamber, 1, 1, 10).flag, True)
+check("bool then int (int cell)", cell(chamber, 1, 1, 11).flag, 1)
+
+# int column from a DataFrame, then a float value from a dict
+chamber.set_cell_attrs(pd.DataFrame({"sl": [1, 1], "l": [2, 2], "w": [10, 11], "time": [300, 301]}))
+chamber.set_cell_attrs([{"sl": 1, "l": 2, "w": 12, "time": 302.5}])
+check("int then float (int cell)", cell(chamber, 1, 2, 10).time, 300)
+check("int then float (float cell)", cell(chamber, 1, 2, 12).time, 302.5)
+
+# nullable Int64 with missing values: NA reads back as None, as DataFrame.to_dict gives
+chamber.set_cell_attrs(
+    pd.DataFrame(
+        {"sl": [3, 3], "l": [1, 1], "w": [5, 6], "size": pd.array([2, None], dtype="Int64")}
+    )
+)
+check("Int64 value", cell(chamber, 3, 1, 5).size, 2)
+assert cell(chamber, 3, 1, 6).size is None, "Int64 NA should read back as None"
+print("Int64 NA: None")
+
+# float identifiers, e.g. after a merge with missing values
+chamber.set_cell_attrs(pd.DataFrame({"sl": [3.0], "l": [2.0], "w": [10.0], "time": [7.5]}))
+check("float identifiers", cell(chamber, 3, 2, 10).time, 7.5)
+for bad in ({"sl": [3], "l": [2.5], "w": [10]}, {"sl": [3], "l": [2], "w": [np.nan]}):
+    try:
+        chamber.set_cell_attrs(pd.DataFrame({**bad, "time": [1.0]}))
+    except ValueError as error:
+        print(f"invalid identifiers {bad}: ValueError({error})")
+    else:
+        raise AssertionError(f"{bad} should raise ValueError")
+
+# cells without a value are masked, and are not readable as attributes
+assert not hasattr(cell(chamber, 1, 2, 20), "time"), "unset cells must not have the attribute"
+print("Column of 'time' in SL1:", chamber.super_layer(1).cell_arrays["time"][1, 8:13])
+
+# writing or deleting a column-wise attribute on the cell updates the super layer column
+chamber.set_cell_attrs(pd.DataFrame({"sl": [1], "l": [1], "w": [10], "time": [300]}))
+chamber_cell = cell(chamber, 1, 1, 10)
+chamber_cell.time = 999
+check("cell write", chamber_cell.time, 999)
+assert chamber.super_layer(1).cell_arrays["time"][0, 9] == 999, "the column must hold the new value"
+print("cell write (column): 999")
+del chamber_cell.time
+assert not hasattr(chamber_cell, "time"), "deleted attributes must not be readable"
+assert chamber.super_layer(1).cell_arrays["time"].mask[0, 9], "deleted attributes must be masked"
+print("cell delete: masked")
+
+# private (_-prefixed) attributes always stay on the cells
+chamber.set_cell_attrs(pd.DataFrame({"sl": [1], "l": [1], "w": [12], "_flag": [1]}))
+chamber.set_cell_attrs({"sl": 1, "l": 1, "w": 13, "_flag": 2})
+check("private attribute (DataFrame)", cell(chamber, 1, 1, 12)._flag, 1)
+check("private attribute (dict)", cell(chamber, 1, 1, 13)._flag, 2)
+assert "_flag" not in chamber.super_layer(1).cell_arrays, "private attributes must not be columns"
+
+# datetime and timedelta values read back as pandas scalars, as DataFrame.to_dict gives
+chamber.set_cell_attrs(
+    pd.DataFrame(
+        {
+            "sl": [1, 1],
+            "l": [3, 3],
+            "w": [10, 11],
+            "stamp": pd.to_datetime(["2024-05-01 10:00", None]),
+            "delay": pd.to_timedelta([25, 50], unit="ns"),
+        }
+    )
+)
+check("datetime value", cell(chamber, 1, 3, 10).stamp, pd.Timestamp("2024-05-01 10:00"))
+assert cell(chamber, 1, 3, 11).stamp is pd.NaT, "missing datetimes should read back as NaT"
+check("timedelta value", cell(chamber, 1, 3, 11).delay, pd.Timedelta(50, unit="ns"))